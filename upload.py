@@ -1,16 +1,29 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox
 import os
+import sys
 import configparser
+import tempfile
 from pathlib import Path
+from types import MappingProxyType
 import logging
 import subprocess
-import socket
+import shutil
+import time
+import functools
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Optional, Tuple, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Config:
     """Handles configuration management"""
@@ -34,24 +47,59 @@ class Config:
     
     def _load_config(self):
         """Load configuration from file"""
-        self.config.read(self.config_file)
+        # _ensure_config_exists guarantees the file, so read it directly
+        with open(self.config_file, 'r', buffering=65536) as file:
+            self.config.read_file(file)
+        self._cache_settings()
+    
+    def _cache_settings(self):
+        """Cache parsed settings so getters don't go through ConfigParser"""
+        self._save_folder = self.config.get('Paths', 'SaveFolderPath', fallback='')
+        self._companion_ip = self.config.get('Companion', 'CompanionIP', fallback='')
+        self._show_refresh = self.config.getboolean('UI', 'ShowRefreshButton', fallback=False)
+        try:
+            poll_interval_ms = self.config.getint('UI', 'PollIntervalMs', fallback=50)
+        except ValueError:
+            logging.warning("Invalid PollIntervalMs in config, using 50")
+            poll_interval_ms = 50
+        # after(0) would re-poll background tasks in a busy loop
+        self._poll_interval_ms = max(1, poll_interval_ms)
     
     def _save_config(self):
         """Save configuration to file"""
-        with open(self.config_file, 'w') as file:
-            self.config.write(file)
+        # Write to a temp file and swap it in so an interrupted save can't
+        # leave a truncated INI behind
+        file = tempfile.NamedTemporaryFile(
+            'w', dir=self.config_folder, suffix='.tmp', delete=False
+        )
+        try:
+            with file:
+                self.config.write(file)
+            os.replace(file.name, self.config_file)
+        except BaseException:
+            os.remove(file.name)
+            raise
     
     def get_save_folder(self) -> str:
-        return self.config.get('Paths', 'SaveFolderPath', fallback='')
+        return self._save_folder
     
     def get_companion_ip(self) -> str:
-        return self.config.get('Companion', 'CompanionIP', fallback='')
+        return self._companion_ip
     
     def get_show_refresh_button(self) -> bool:
-        return self.config.getboolean('UI', 'ShowRefreshButton', fallback=False)
+        return self._show_refresh
+    
+    def get_poll_interval_ms(self) -> int:
+        return self._poll_interval_ms
     
     def update_settings(self, save_folder: str, companion_ip: str, show_refresh: bool = False):
         """Update configuration settings"""
+        # Nothing to write if the settings are unchanged
+        if (save_folder, companion_ip, show_refresh) == (
+            self._save_folder, self._companion_ip, self._show_refresh
+        ):
+            return
+        
         # Ensure all sections exist
         if not self.config.has_section('Paths'):
             self.config.add_section('Paths')
@@ -63,92 +111,160 @@ class Config:
         self.config.set('Paths', 'SaveFolderPath', save_folder)
         self.config.set('Companion', 'CompanionIP', companion_ip)
         self.config.set('UI', 'ShowRefreshButton', str(show_refresh))
+        self._cache_settings()
         self._save_config()
     
     def is_valid(self) -> bool:
         """Check if required configuration is present"""
-        return bool(self.get_save_folder() and self.get_companion_ip())
+        return bool(self._save_folder and self._companion_ip)
 
 
 class CompanionAPI:
     """Handles communication with Companion API"""
     
+    # Song data keys mapped to Companion custom variable names
+    _VARIABLE_MAP = MappingProxyType({
+        'song1': '9amSong1',
+        'song2': '9amSong2', 
+        'song3': '9amSong3',
+        'start': '9amStart',
+        'end': '9amEnd',
+        'communion': '9amCommunion',
+        'song1path': '9amSong1Path',
+        'song2path': '9amSong2Path',
+        'song3path': '9amSong3Path',
+        'startpath': '9amStartPath',
+        'endpath': '9amEndPath',
+        'communionpath': '9amCommunionPath'
+    })
+    
     def __init__(self, companion_ip: str):
         self.companion_ip = companion_ip
         self.base_url = f"http://{companion_ip}:8000/api/custom-variable"
         self.timeout = 5
-        
-        # Variable mappings
-        self.variable_map = {
-            'song1': '9amSong1',
-            'song2': '9amSong2', 
-            'song3': '9amSong3',
-            'start': '9amStart',
-            'end': '9amEnd',
-            'communion': '9amCommunion',
-            'song1path': '9amSong1Path',
-            'song2path': '9amSong2Path',
-            'song3path': '9amSong3Path',
-            'startpath': '9amStartPath',
-            'endpath': '9amEndPath',
-            'communionpath': '9amCommunionPath'
+        self.max_workers = 8
+        self.bulk_url = f"http://{companion_ip}:8000/api/custom-variables/bulk"
+        self.bulk_supported: Optional[bool] = None  # Unknown until first upload
+        
+        # Variable URLs are static per instance; the value goes in the query params
+        self._service_date_url = f"{self.base_url}/ServiceDate/value"
+        self._variable_urls = {
+            var_name: f"{self.base_url}/{var_name}/value"
+            for var_name in ("ServiceDate", *self._VARIABLE_MAP.values())
         }
+        
+        # Reuse pooled connections for every call to Companion; the pool must be
+        # at least max_workers wide so parallel posts don't queue on one socket
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
     
     def test_connection(self) -> bool:
         """Test if Companion is reachable at the configured IP"""
         try:
-            # First check if the port is open
-            with socket.create_connection((self.companion_ip, 8000), timeout=3):
-                pass
-            
-            # Then try to make an API call
-            url = f"{self.base_url}/ServiceDate/value"
-            response = requests.get(url, timeout=3)
-            return response.status_code == 200
-        except (socket.error, requests.RequestException):
+            # Any 2xx/4xx answer means the HTTP server is up; the connection
+            # then stays in the pool for the first real call
+            response = self.session.head(self._service_date_url, timeout=3)
+            return response.status_code < 500
+        except requests.RequestException:
             return False
     
     def get_current_service_date(self) -> Optional[str]:
         """Fetch current service date from Companion"""
         try:
-            url = f"{self.base_url}/ServiceDate/value"
-            response = requests.get(url, timeout=self.timeout)
+            response = self.session.get(self._service_date_url, timeout=self.timeout)
             response.raise_for_status()
             return response.text.strip()
         except requests.RequestException as e:
-            logging.error(f"Failed to fetch current service date: {e}")
+            logging.error("Failed to fetch current service date: %s", e)
             return None
     
     def update_service_data(self, song_data: Dict[str, str], service_date: str) -> List[str]:
         """Send service data to Companion API"""
-        errors = []
-        
-        # Update service date first
+        payload = {"ServiceDate": service_date}
+        payload.update({
+            var_name: song_data[key]
+            for key, var_name in self._VARIABLE_MAP.items()
+            if key in song_data
+        })
+        
+        # Prefer a single bulk call; fall back if the server doesn't support it
+        if self.bulk_supported is not False:
+            errors = self.bulk_update(payload)
+            if errors is not None:
+                return errors
+        
+        return self._update_variables(payload)
+    
+    def bulk_update(self, payload: Dict[str, str]) -> Optional[List[str]]:
+        """Send all variables in one request, or None to fall back to per-variable updates"""
         try:
-            url = f"{self.base_url}/ServiceDate/value?value={service_date}"
-            requests.post(url, timeout=self.timeout)
+            response = self.session.post(self.bulk_url, json=payload, timeout=self.timeout)
+            if response.status_code in (404, 405):
+                logging.info("Companion has no bulk endpoint, using per-variable updates")
+                self.bulk_supported = False
+                return None
+            response.raise_for_status()
+            self.bulk_supported = True
+            return []
         except requests.RequestException as e:
-            errors.append(f"ServiceDate: {e}")
+            # Until bulk has worked once, any failure may just mean it isn't
+            # supported, so let this upload go through the per-variable endpoint
+            if not self.bulk_supported:
+                logging.info("Bulk update failed, using per-variable updates: %s", e)
+                return None
+            return [f"Bulk update: {e}"]
+    
+    def _update_variables(self, payload: Dict[str, str]) -> List[str]:
+        """Send each variable as its own request, posted concurrently"""
+        errors = []
         
-        # Update song data
-        for key, value in song_data.items():
-            var_name = self.variable_map.get(key)
-            if var_name:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.session.post,
+                    self._variable_urls[var_name],
+                    params={'value': value},
+                    timeout=self.timeout
+                ): var_name
+                for var_name, value in payload.items()
+            }
+            for future in as_completed(futures):
                 try:
-                    url = f"{self.base_url}/{var_name}/value?value={value}"
-                    requests.post(url, timeout=self.timeout)
+                    future.result()
                 except requests.RequestException as e:
-                    errors.append(f"{var_name}: {e}")
+                    errors.append(f"{futures[future]}: {e}")
         
         return errors
+    
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
 
 
 class VLCLauncher:
     """Handles VLC launching functionality"""
     
-    @staticmethod
-    def find_vlc_path() -> Optional[str]:
+    # Found path is kept for the process lifetime; a miss is retried after the TTL
+    _cached_path: Optional[str] = None
+    _not_found_until: float = 0.0
+    NOT_FOUND_TTL = 30.0
+    
+    @classmethod
+    def find_vlc_path(cls) -> Optional[str]:
         """Find VLC installation path on Windows"""
+        if cls._cached_path:
+            return cls._cached_path
+        if time.monotonic() < cls._not_found_until:
+            return None
+        
+        cls._cached_path = cls._probe_vlc_path()
+        if not cls._cached_path:
+            cls._not_found_until = time.monotonic() + cls.NOT_FOUND_TTL
+        return cls._cached_path
+    
+    @staticmethod
+    def _probe_vlc_path() -> Optional[str]:
+        """Search the usual install locations and PATH for VLC"""
         common_paths = [
             r"C:\Program Files\VideoLAN\VLC\vlc.exe",
             r"C:\Program Files (x86)\VideoLAN\VLC\vlc.exe",
@@ -160,13 +276,7 @@ class VLCLauncher:
                 return path
         
         # Try to find in PATH
-        try:
-            subprocess.run(["vlc", "--version"], capture_output=True, timeout=3)
-            return "vlc"
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            pass
-        
-        return None
+        return shutil.which("vlc")
     
     @staticmethod
     def launch_vlc() -> bool:
@@ -180,115 +290,97 @@ class VLCLauncher:
             subprocess.Popen([vlc_path], shell=False)
             return True
         except Exception as e:
-            logging.error(f"Failed to launch VLC: {e}")
+            logging.error("Failed to launch VLC: %s", e)
             return False
 
 
 class ServiceDataManager:
     """Manages service data operations"""
     
-    def __init__(self, json_path: str):
-        self.json_path = Path(json_path)
-        self.data = {}
-        self.load_data()
-    
-    def load_data(self) -> bool:
-        """Load service data from JSON file"""
-        try:
-            if self.json_path.exists():
-                with open(self.json_path, 'r', encoding='utf-8') as file:
-                    self.data = json.load(file)
-                logging.info("Service data loaded successfully")
-                return True
-            else:
-                logging.warning(f"JSON file not found: {self.json_path}")
-                return False
-        except Exception as e:
-            logging.error(f"Failed to load service data: {e}")
-            return False
-    
-    def get_sorted_dates(self) -> List[str]:
-        """Get sorted list of service dates"""
-        return sorted(self.data.keys(), key=lambda x: datetime.strptime(x, '%d/%m/%Y'))
-    
-    def find_nearest_upcoming_service(self) -> Optional[Tuple[str, Dict[str, Any]]]:
-        """Find the nearest upcoming service"""
-        today = datetime.today().date()
-        future_events = [
-            (date_str, details) 
-            for date_str, details in self.data.items() 
-            if datetime.strptime(date_str, '%d/%m/%Y').date() >= today
-        ]
-        
-        if future_events:
-            future_events.sort(key=lambda x: datetime.strptime(x[0], '%d/%m/%Y').date())
-            return future_events[0]
-        return None
-    
-    def extract_song_data(self, event_data: Dict[str, Any]) -> Dict[str, str]:
-        """Extract song data from event data"""
-        song_keys = [
-            'song1', 'song2', 'song3', 'start', 'end', 'communion',
-            'song1path', 'song2path', 'song3path', 'startpath', 'endpath', 'communionpath'
-        ]
-        return {key: event_data.get(key, 'none') for key in song_keys}
-    
-    def get_service_data(self, date_str: str) -> Dict[str, str]:
-        """Get service data for a specific date"""
-        event_data = self.data.get(date_str, {})
-        return self.extract_song_data(event_data)
-    """Manages service data operations"""
+    _SONG_KEYS = (
+        'song1', 'song2', 'song3', 'start', 'end', 'communion',
+        'song1path', 'song2path', 'song3path', 'startpath', 'endpath', 'communionpath'
+    )
+    _DISPLAY_KEYS = ('song1', 'song2', 'song3', 'start', 'end', 'communion')
     
     def __init__(self, json_path: str):
         self.json_path = Path(json_path)
         self.data = {}
+        self._parsed_dates = {}
+        self._sorted_dates: Tuple[str, ...] = ()
+        self._file_signature: Optional[Tuple[int, int]] = None
         self.load_data()
     
     def load_data(self) -> bool:
         """Load service data from JSON file"""
         try:
-            if self.json_path.exists():
-                with open(self.json_path, 'r', encoding='utf-8') as file:
-                    self.data = json.load(file)
-                logging.info("Service data loaded successfully")
-                return True
-            else:
-                logging.warning(f"JSON file not found: {self.json_path}")
+            try:
+                stat = self.json_path.stat()
+            except FileNotFoundError:
+                logging.warning("JSON file not found: %s", self.json_path)
                 return False
+            
+            # Skip the re-parse when the file hasn't changed since the last load
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self._file_signature:
+                return True
+            
+            raw = self.json_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            # Parse each date key once per load rather than on every lookup
+            self._parsed_dates = {
+                date_str: datetime.strptime(date_str, '%d/%m/%Y').date()
+                for date_str in data
+            }
+            self._sorted_dates = tuple(
+                sorted(self._parsed_dates, key=self._parsed_dates.__getitem__)
+            )
+            self.data = data
+            self._file_signature = signature
+            logging.info("Service data loaded successfully")
+            return True
         except Exception as e:
-            logging.error(f"Failed to load service data: {e}")
+            logging.error("Failed to load service data: %s", e)
             return False
     
-    def get_sorted_dates(self) -> List[str]:
-        """Get sorted list of service dates"""
-        return sorted(self.data.keys(), key=lambda x: datetime.strptime(x, '%d/%m/%Y'))
+    def get_sorted_dates(self) -> Tuple[str, ...]:
+        """Get sorted service dates"""
+        return self._sorted_dates
     
     def find_nearest_upcoming_service(self) -> Optional[Tuple[str, Dict[str, Any]]]:
         """Find the nearest upcoming service"""
         today = datetime.today().date()
-        future_events = [
-            (date_str, details) 
-            for date_str, details in self.data.items() 
-            if datetime.strptime(date_str, '%d/%m/%Y').date() >= today
-        ]
+        nearest = min(
+            (
+                (date_str, service_date)
+                for date_str, service_date in self._parsed_dates.items()
+                if service_date >= today
+            ),
+            key=lambda x: x[1],
+            default=None
+        )
         
-        if future_events:
-            future_events.sort(key=lambda x: datetime.strptime(x[0], '%d/%m/%Y').date())
-            return future_events[0]
+        if nearest:
+            return nearest[0], self.data[nearest[0]]
         return None
     
     def extract_song_data(self, event_data: Dict[str, Any]) -> Dict[str, str]:
         """Extract song data from event data"""
-        song_keys = [
-            'song1', 'song2', 'song3', 'start', 'end', 'communion',
-            'song1path', 'song2path', 'song3path', 'startpath', 'endpath', 'communionpath'
-        ]
-        return {key: event_data.get(key, 'none') for key in song_keys}
+        get = event_data.get
+        return {key: get(key, 'none') for key in self._SONG_KEYS}
     
     def get_service_data(self, date_str: str) -> Dict[str, str]:
         """Get service data for a specific date"""
         event_data = self.data.get(date_str, {})
         return self.extract_song_data(event_data)
+    
+    def get_song_entries(self, date_str: str) -> Dict[str, Tuple[str, str]]:
+        """Get (name, path) pairs for each displayed song on a date"""
+        song_data = self.get_service_data(date_str)
+        return {
+            key: (song_data[key], song_data[f"{key}path"])
+            for key in self._DISPLAY_KEYS
+        }
 
 
 class CompanionConnectionDialog:
@@ -303,8 +395,6 @@ class CompanionConnectionDialog:
     def setup_ui(self, current_ip: str):
         """Setup the connection dialog UI"""
         self.window.title("Companion Connection Failed")
-        self.window.geometry("400x200")
-        self.window.resizable(False, False)
         self.window.grab_set()  # Make dialog modal
         
         # Center the dialog
@@ -371,7 +461,12 @@ class CompanionConnectionDialog:
         # Test connection
         try:
             test_api = CompanionAPI(new_ip)
-            if test_api.test_connection():
+            try:
+                connected = test_api.test_connection()
+            finally:
+                test_api.close()
+            
+            if connected:
                 # Save the new IP
                 self.config.update_settings(
                     self.config.get_save_folder(),
@@ -401,6 +496,9 @@ class CompanionConnectionDialog:
         """Get the new IP if successful"""
         self.window.wait_window()
         return self.new_ip
+
+
+class SettingsDialog:
     """Settings dialog window"""
     
     def __init__(self, parent, config: Config, refresh_callback):
@@ -412,8 +510,7 @@ class CompanionConnectionDialog:
     def setup_ui(self):
         """Setup the settings UI"""
         self.window.title("Settings")
-        self.window.geometry("500x200")
-        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
         
         # Save folder path
         ttk.Label(self.window, text="Save Folder Path:").grid(
@@ -450,13 +547,14 @@ class CompanionConnectionDialog:
         button_frame.grid(row=3, columnspan=2, pady=20)
         
         ttk.Button(button_frame, text="Save", command=self.save_settings).pack(side="left", padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.window.destroy).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.hide).pack(side="left", padx=5)
         
         # Configure column weights
         self.window.columnconfigure(1, weight=1)
     
     def browse_folder(self):
         """Open folder browser dialog"""
+        from tkinter import filedialog
         folder = filedialog.askdirectory(initialdir=self.save_folder_var.get())
         if folder:
             self.save_folder_var.set(folder)
@@ -474,12 +572,27 @@ class CompanionConnectionDialog:
         self.config.update_settings(save_folder, companion_ip, show_refresh)
         self.refresh_callback()
         messagebox.showinfo("Success", "Settings saved successfully!")
-        self.window.destroy()
+        self.hide()
+    
+    def show(self):
+        """Show the dialog again with the current settings"""
+        self.save_folder_var.set(self.config.get_save_folder())
+        self.companion_ip_var.set(self.config.get_companion_ip())
+        self.show_refresh_var.set(self.config.get_show_refresh_button())
+        self.window.deiconify()
+        self.window.lift()
+    
+    def hide(self):
+        """Hide the dialog so it can be reopened without rebuilding it"""
+        self.window.withdraw()
 
 
 class ServiceManagerGUI:
     """Main GUI application"""
     
+    _MSG_OK = "✅ Data refreshed successfully"
+    _MSG_FAIL = "❌ Failed to refresh data"
+    
     def __init__(self):
         # Setup logging
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -488,6 +601,13 @@ class ServiceManagerGUI:
         self.config = Config()
         self.data_manager = None
         self.api = None
+        self._settings_dialog: Optional[SettingsDialog] = None
+        
+        # Network calls run here so they never block the Tk event loop
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        
+        # Formatted song display per date, cleared whenever the data reloads
+        self._display_cache: Dict[str, Dict[str, str]] = {}
         
         # Check configuration
         if not self.config.is_valid():
@@ -495,40 +615,51 @@ class ServiceManagerGUI:
         
         self._initialize_components()
         
-        # Check Companion connection at startup
-        if self.api and not self._check_companion_connection():
-            self._prompt_for_companion_ip()
-        
         self.setup_gui()
         self._load_initial_data()
+        
+        # Check Companion connection at startup
+        self._check_companion_connection()
     
-    def _check_companion_connection(self) -> bool:
-        """Check if Companion is reachable"""
+    def _check_companion_connection(self):
+        """Check in the background if Companion is reachable"""
         if not self.api:
-            return False
+            return
         
-        logging.info(f"Testing connection to Companion at {self.api.companion_ip}")
-        return self.api.test_connection()
+        logging.info("Testing connection to Companion at %s", self.api.companion_ip)
+        self._run_in_background(self.api.test_connection, self._on_connection_checked)
+    
+    def _on_connection_checked(self, future):
+        """Prompt for a new IP if the startup connection test failed"""
+        if not future.result():
+            self._prompt_for_companion_ip()
+    
+    def _run_in_background(self, func, callback, *args):
+        """Run func on the executor and pass its future to callback on the Tk thread"""
+        future = self._executor.submit(func, *args)
+        self.root.after(self.config.get_poll_interval_ms(), self._poll_future, future, callback)
+    
+    def _poll_future(self, future, callback):
+        """Wait for a background call to finish without blocking the event loop"""
+        if future.done():
+            callback(future)
+        else:
+            self.root.after(self.config.get_poll_interval_ms(), self._poll_future, future, callback)
     
     def _prompt_for_companion_ip(self):
         """Prompt user to update Companion IP if connection fails"""
-        # Create a temporary root for the dialog
-        temp_root = tk.Tk()
-        temp_root.withdraw()
-        
         dialog = CompanionConnectionDialog(
-            temp_root, 
+            self.root, 
             self.config.get_companion_ip(), 
             self.config
         )
         
         new_ip = dialog.get_result()
-        temp_root.destroy()
         
         if new_ip:
             # Reinitialize components with new IP
-            self._initialize_components()
-            logging.info(f"Updated Companion IP to: {new_ip}")
+            self._refresh_components()
+            logging.info("Updated Companion IP to: %s", new_ip)
         else:
             logging.warning("Continuing with potentially unreachable Companion IP")
     
@@ -554,6 +685,9 @@ class ServiceManagerGUI:
         if save_folder and companion_ip:
             json_path = Path(save_folder) / "selections.json"
             self.data_manager = ServiceDataManager(str(json_path))
+            self._display_cache.clear()
+            if self.api:
+                self.api.close()
             self.api = CompanionAPI(companion_ip)
     
     def _refresh_components(self):
@@ -567,7 +701,10 @@ class ServiceManagerGUI:
         """Setup the main GUI"""
         self.root = tk.Tk()
         self.root.title("Christ Church Service Activation")
-        self.root.geometry("500x450")
+        # The process is DPI aware, so scale the 96-DPI layout size to the display
+        scale = self.root.winfo_fpixels('1i') / 96
+        self.root.geometry(f"{round(500 * scale)}x{round(450 * scale)}")
+        self.root.bind("<Destroy>", self._on_destroy)
         
         # Menu bar
         self._setup_menu()
@@ -633,14 +770,22 @@ class ServiceManagerGUI:
             ttk.Label(frame, text=f"{key.capitalize()}:", font=("Arial", 12)).pack(side='left', padx=10)
             ttk.Label(frame, textvariable=var, font=("Arial", 12)).pack(side='right', padx=10)
         
-        # Feedback label
+        # Feedback label; colours come from pre-registered styles so a status
+        # update is a single configure of text and style
+        style = ttk.Style(self.root)
+        style.configure("Success.TLabel", foreground="green")
+        style.configure("Info.TLabel", foreground="blue")
+        style.configure("Warning.TLabel", foreground="orange")
+        style.configure("Error.TLabel", foreground="red")
+        
         self.feedback_label = ttk.Label(
             self.root, 
             text="", 
             font=("Arial", 12), 
-            foreground="green"
+            style="Success.TLabel"
         )
         self.feedback_label.pack(pady=10)
+        self._feedback_path = str(self.feedback_label)
         
         # Upload button
         self.upload_button = tk.Button(
@@ -668,13 +813,14 @@ class ServiceManagerGUI:
         else:
             self.refresh_button.pack_forget()
     
+    def _set_feedback(self, text: str, style: str):
+        """Show a status message in the feedback label"""
+        self.feedback_label.tk.call(self._feedback_path, 'configure', '-text', text, '-style', style)
+    
     def _load_initial_data(self):
         """Load initial data and set default selections"""
         if not self.data_manager or not self.data_manager.data:
-            self.feedback_label.config(
-                text="❌ No service data found in selections.json.", 
-                foreground="red"
-            )
+            self._set_feedback("❌ No service data found in selections.json.", "Error.TLabel")
             return
         
         # Populate date dropdown
@@ -689,9 +835,9 @@ class ServiceManagerGUI:
         elif date_options:
             self.date_var.set(date_options[0])
             self.update_song_display(date_options[0])
-            self.feedback_label.config(
-                text="⚠ No upcoming service found. Defaulted to earliest date.", 
-                foreground="orange"
+            self._set_feedback(
+                "⚠ No upcoming service found. Defaulted to earliest date.", 
+                "Warning.TLabel"
             )
         
         self.update_current_service_date()
@@ -706,14 +852,17 @@ class ServiceManagerGUI:
         if not self.data_manager:
             return
             
-        service_data = self.data_manager.get_service_data(date_str)
-        event_data = self.data_manager.data.get(date_str, {})
+        display = self._display_cache.get(date_str)
+        if display is None:
+            entries = self.data_manager.get_song_entries(date_str)
+            display = {
+                key: self._format_display_filename(value, path)
+                for key, (value, path) in entries.items()
+            }
+            self._display_cache[date_str] = display
         
         for key, var in self.song_vars.items():
-            value = service_data.get(key, "")
-            path = event_data.get(f"{key}path", "")
-            display_value = self._format_display_filename(value, path)
-            var.set(display_value)
+            var.set(display[key])
     
     def _format_display_filename(self, filename: str, path: str) -> str:
         """Format filename for display"""
@@ -721,10 +870,9 @@ class ServiceManagerGUI:
             return "—"
         
         filename = filename.strip()
-        filename_no_ext = os.path.splitext(filename)[0]
-        file_extension = os.path.splitext(path)[1].lower()
+        filename_no_ext = filename.rsplit('.', 1)[0] if '.' in filename else filename
         
-        if file_extension == '.xspf':
+        if path[-5:].lower() == '.xspf':
             return f"{filename_no_ext} 🎵"
         return filename_no_ext
     
@@ -733,8 +881,13 @@ class ServiceManagerGUI:
         if not self.api:
             self.current_service_label.config(text="API not configured")
             return
-            
-        current_date = self.api.get_current_service_date()
+        
+        self.current_service_label.config(text="Checking…")
+        self._run_in_background(self.api.get_current_service_date, self._show_current_service_date)
+    
+    def _show_current_service_date(self, future):
+        """Display the service date fetched in the background"""
+        current_date = future.result()
         if current_date:
             self.current_service_label.config(text=f"Current Service Date: {current_date}")
         else:
@@ -748,29 +901,35 @@ class ServiceManagerGUI:
         
         self.upload_button.config(state="disabled", text="Activating...")
         
+        selected_date = self.date_var.get()
+        service_data = self.data_manager.get_service_data(selected_date)
+        
+        self._run_in_background(
+            self.api.update_service_data,
+            lambda future: self._finish_upload(future, selected_date),
+            service_data,
+            selected_date
+        )
+    
+    def _finish_upload(self, future, selected_date: str):
+        """Report the result of a background upload and launch VLC"""
         try:
-            selected_date = self.date_var.get()
-            service_data = self.data_manager.get_service_data(selected_date)
-            
-            errors = self.api.update_service_data(service_data, selected_date)
+            errors = future.result()
             
             if errors:
                 error_msg = "\n".join(errors[:5])  # Show first 5 errors
                 messagebox.showwarning("Upload Warnings", f"Some updates failed:\n{error_msg}")
             
-            self.feedback_label.config(
-                text=f"Service for {selected_date} activated!", 
-                foreground="green"
-            )
+            self._set_feedback(f"Service for {selected_date} activated!", "Success.TLabel")
             self.update_current_service_date()
             
             # Launch VLC
             self._launch_vlc()
             
         except Exception as e:
-            logging.error(f"Upload failed: {e}")
+            logging.error("Upload failed: %s", e)
             messagebox.showerror("Error", f"Upload failed: {e}")
-            self.feedback_label.config(text="❌ Upload failed", foreground="red")
+            self._set_feedback("❌ Upload failed", "Error.TLabel")
         
         finally:
             self.upload_button.config(state="normal", text="Activate Service")
@@ -804,14 +963,13 @@ class ServiceManagerGUI:
         ]
         
         folder_opened = False
-        for folder in vlc_folders:
-            if os.path.exists(folder):
-                try:
-                    subprocess.run(["explorer", folder])
-                    folder_opened = True
-                    break
-                except Exception as e:
-                    logging.error(f"Failed to open folder {folder}: {e}")
+        folder = next((f for f in vlc_folders if os.path.isdir(f)), None)
+        if folder:
+            try:
+                subprocess.Popen(["explorer", folder])
+                folder_opened = True
+            except Exception as e:
+                logging.error("Failed to open folder %s: %s", folder, e)
         
         if not folder_opened:
             messagebox.showinfo(
@@ -824,12 +982,16 @@ class ServiceManagerGUI:
     def refresh_data(self):
         """Refresh service data from JSON"""
         if not self.data_manager:
-            self.feedback_label.config(text="❌ Data manager not configured", foreground="red")
+            self._set_feedback("❌ Data manager not configured", "Error.TLabel")
             return
         
         previous_date = self.date_var.get()
+        previous_data = self.data_manager.data
         
         if self.data_manager.load_data():
+            if self.data_manager.data is not previous_data:
+                self._display_cache.clear()
+            
             # Update dropdown options
             date_options = self.data_manager.get_sorted_dates()
             self.date_dropdown['values'] = date_options
@@ -842,28 +1004,87 @@ class ServiceManagerGUI:
                 self.date_var.set(date_options[0])
                 self.update_song_display(date_options[0])
             
-            self.feedback_label.config(text="✅ Data refreshed successfully", foreground="blue")
+            self._set_feedback(self._MSG_OK, "Info.TLabel")
         else:
-            self.feedback_label.config(text="❌ Failed to refresh data", foreground="red")
+            self._set_feedback(self._MSG_FAIL, "Error.TLabel")
     
     def open_settings(self):
-        """Open settings dialog"""
-        SettingsDialog(self.root, self.config, self._refresh_components)
+        """Open settings dialog once the current event has been handled"""
+        self.root.after_idle(self._show_settings)
+    
+    def _show_settings(self):
+        """Show the settings dialog, building it on first use"""
+        # The dialog is only a handful of widgets, so keeping it hidden between
+        # opens costs little memory and makes reopening immediate
+        dialog = self._settings_dialog
+        if dialog is None or not dialog.window.winfo_exists():
+            self._settings_dialog = SettingsDialog(self.root, self.config, self._refresh_components)
+        else:
+            dialog.show()
+    
+    def _on_destroy(self, event):
+        """Release resources when the main window is destroyed"""
+        if event.widget is not self.root:
+            return
+        self._executor.shutdown(wait=False)
+        if self.api:
+            self.api.close()
     
     def run(self):
         """Start the GUI application"""
         self.root.mainloop()
 
 
+@functools.lru_cache(maxsize=None)
+def _enable_dpi_awareness():
+    """Make the process DPI aware on Windows; later calls are no-ops"""
+    if sys.platform != 'win32':
+        return
+    
+    import ctypes
+    # Per-monitor V2 (Windows 10 1703+), then per-monitor (8.1+), then system DPI aware
+    try:
+        if not ctypes.windll.user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(-4)):
+            raise OSError("SetProcessDpiAwarenessContext failed")
+    except (AttributeError, OSError):
+        try:
+            ctypes.windll.shcore.SetProcessDpiAwareness(2)
+        except (AttributeError, OSError):
+            ctypes.windll.user32.SetProcessDPIAware()
+
+
 def main():
     """Main entry point"""
+    # Bail out before loading Tk when there is nothing to display on
+    if os.environ.get('CCM_HEADLESS') == '1':
+        logging.error("CCM_HEADLESS is set, not starting the GUI")
+        return 1
+    # Only X11/Wayland need a display variable; Windows and macOS (Aqua) don't
+    if sys.platform not in ('win32', 'darwin') and not (
+        os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')
+    ):
+        logging.error("No display available, not starting the GUI")
+        return 1
+    
+    _enable_dpi_awareness()
+    
     try:
         app = ServiceManagerGUI()
-        app.run()
     except Exception as e:
-        logging.error(f"Application error: {e}")
-        messagebox.showerror("Fatal Error", f"Application failed to start: {e}")
+        # Drop frame locals so the half-built widgets can be freed
+        traceback.clear_frames(e.__traceback__)
+        logging.error("Application error: %s", e)
+        message = f"Application failed to start: {e}"
+        if sys.platform == 'win32':
+            import ctypes
+            ctypes.windll.user32.MessageBoxW(0, message, "Fatal Error", 0x10)  # MB_ICONERROR
+        else:
+            sys.stderr.write(f"{message}\n")
+        return 1
+    
+    app.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())